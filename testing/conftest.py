@@ -1,10 +1,13 @@
 """
 Pytest configuration for testing directory.
+
+The app directory is put on the import path by `pythonpath` in pytest.ini.
 """
-import sys
-from pathlib import Path
+import pytest
+
 
-# Add the app directory to Python path
-project_root = Path(__file__).parent.parent
-app_dir = project_root / 'web' / 'app'
-sys.path.insert(0, str(app_dir))
+@pytest.fixture(scope='session')
+def prefetched_data():
+    """Fetch BTC and ETH combined data once per session, concurrently."""
+    from data_manager import DataManager
+    return DataManager().fetch_combined_data_batch(['BTCUSDT', 'ETHUSDT'])
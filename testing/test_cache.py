@@ -0,0 +1,160 @@
+"""
+Pytest tests for the in-memory and on-disk caches.
+"""
+import logging
+
+import cache as cache_module
+import pytest
+from cache import FileCache, MemoryCache, ttl_cache
+
+
+class FakeClock:
+    """Stands in for the time module inside cache, with a manually advanced monotonic clock."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def monotonic(self):
+        return self.now
+    
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze the caches' clock; advance it by assigning clock.now."""
+    fake = FakeClock()
+    monkeypatch.setattr(cache_module, 'time', fake)
+    return fake
+
+
+@pytest.fixture
+def file_cache(tmp_path):
+    """A FileCache in a temporary directory."""
+    return FileCache(str(tmp_path), 'test')
+
+
+class TestFileCache:
+    """Entries are written atomically and read back with their write time."""
+    
+    def test_set_then_get_entry(self, file_cache):
+        key = FileCache.make_key('BTCUSDT', '1h', 1000)
+        file_cache.set(key, [[1, '2.5']])
+        
+        fetched_at, data = file_cache.get_entry(key)
+        assert data == [[1, '2.5']]
+        assert file_cache.get(key, ttl=60) == [[1, '2.5']]
+        assert file_cache.get(key, ttl=-1) is None
+    
+    def test_set_leaves_no_temporary_file(self, file_cache):
+        key = FileCache.make_key('a')
+        file_cache.set(key, {'x': 1})
+        file_cache.set(key, {'x': 2})
+        
+        assert [p.name for p in file_cache.directory.iterdir()] == [f"{key}.json"]
+        assert file_cache.get(key) == {'x': 2}
+    
+    def test_failed_write_keeps_previous_entry(self, file_cache, caplog):
+        key = FileCache.make_key('a')
+        file_cache.set(key, {'x': 1})
+        
+        with caplog.at_level(logging.WARNING, logger='cache'):
+            file_cache.set(key, {'x': object()})
+        
+        assert "Error writing cache entry" in caplog.text
+        assert file_cache.get(key) == {'x': 1}
+        assert [p.name for p in file_cache.directory.iterdir()] == [f"{key}.json"]
+    
+    def test_missing_or_corrupt_entry_is_none(self, file_cache):
+        key = FileCache.make_key('a')
+        assert file_cache.get_entry(key) is None
+        
+        file_cache.directory.mkdir(parents=True)
+        file_cache._path(key).write_text('{not json')
+        assert file_cache.get_entry(key) is None
+
+
+class TestMemoryCache:
+    """Entries expire after their own ttl, defaulting to the cache's."""
+    
+    def test_per_entry_ttl(self, clock):
+        cache = MemoryCache(ttl=10)
+        cache.set('default', 1)
+        cache.set('short', 2, ttl=1)
+        cache.set('long', 3, ttl=100)
+        
+        clock.now += 5
+        assert cache.get('short') == (False, None)
+        assert cache.get('default') == (True, 1)
+        
+        clock.now += 10
+        assert cache.get('default') == (False, None)
+        assert cache.get('long') == (True, 3)
+    
+    def test_evicts_least_recently_used(self, clock):
+        cache = MemoryCache(ttl=10, maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        
+        assert cache.get('b') == (False, None)
+        assert cache.get('a') == (True, 1)
+        assert cache.get('c') == (True, 3)
+
+
+class Fetcher:
+    """Counts calls to ttl_cache-wrapped methods."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    @ttl_cache(ttl=lambda args: 1 if args['interval'] == '1m' else 60,
+               should_cache=lambda result: result is not None,
+               bypass=lambda args: not args['cache'])
+    def fetch(self, symbol, interval='1h', empty=False, cache=True):
+        self.calls += 1
+        return None if empty else (symbol, interval, self.calls)
+
+
+@pytest.fixture
+def fetcher():
+    """A Fetcher with a cleared memo (the cache is shared by all instances)."""
+    Fetcher.fetch.cache_clear()
+    yield Fetcher()
+    Fetcher.fetch.cache_clear()
+
+
+class TestTtlCache:
+    """Memoization on bound arguments with per-call ttl, should_cache and bypass."""
+    
+    def test_positional_and_keyword_calls_share_an_entry(self, clock, fetcher):
+        first = fetcher.fetch('BTCUSDT', '1h')
+        assert fetcher.fetch(symbol='BTCUSDT') == first
+        assert fetcher.fetch('BTCUSDT', interval='1h', cache=True) == first
+        assert fetcher.calls == 1
+    
+    def test_ttl_from_arguments(self, clock, fetcher):
+        fetcher.fetch('BTCUSDT', '1m')
+        fetcher.fetch('BTCUSDT', '1h')
+        
+        clock.now += 5
+        fetcher.fetch('BTCUSDT', '1m')
+        fetcher.fetch('BTCUSDT', '1h')
+        assert fetcher.calls == 3
+    
+    def test_rejected_results_are_not_stored(self, clock, fetcher):
+        assert fetcher.fetch('BTCUSDT', empty=True) is None
+        assert fetcher.fetch('BTCUSDT', empty=True) is None
+        assert fetcher.calls == 2
+    
+    def test_bypass_neither_reads_nor_writes(self, clock, fetcher):
+        cached = fetcher.fetch('BTCUSDT')
+        
+        assert fetcher.fetch('BTCUSDT', cache=False) != cached
+        assert fetcher.fetch('BTCUSDT', cache=False) != cached
+        assert fetcher.calls == 3
+        # The memoized entry is still the one stored before the bypassed calls
+        assert fetcher.fetch('BTCUSDT') == cached
+        assert fetcher.calls == 3
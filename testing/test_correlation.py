@@ -1,33 +1,97 @@
 """
 Pytest tests to verify the correlation and beta calculations work correctly.
 """
+import numpy as np
 import pytest
 import pandas as pd
 from data_manager import DataManager
+from interpretation import interpret_corr_beta
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def data_manager():
     """Create a DataManager instance for testing."""
     return DataManager()
 
 
-@pytest.fixture
-def btc_data(data_manager):
+@pytest.fixture(scope="session")
+def btc_data(prefetched_data):
     """Fetch BTC data for testing."""
-    df = data_manager.fetch_combined_data('BTCUSDT')
+    df = prefetched_data['BTCUSDT']
     assert not df.empty, "Failed to fetch BTC data"
     return df
 
 
-@pytest.fixture
-def eth_data(data_manager):
+@pytest.fixture(scope="session")
+def eth_data(prefetched_data):
     """Fetch ETH data for testing."""
-    df = data_manager.fetch_combined_data('ETHUSDT')
+    df = prefetched_data['ETHUSDT']
     assert not df.empty, "Failed to fetch ETH data"
     return df
 
 
+@pytest.fixture(scope="session")
+def aligned_returns(eth_data, btc_data):
+    """ETH and BTC returns aligned by date, computed independently of DataManager."""
+    merged = pd.merge(eth_data[['Date', 'Close']], btc_data[['Date', 'Close']],
+                      on='Date', suffixes=('_eth', '_btc'))
+    return merged['Close_eth'].pct_change(), merged['Close_btc'].pct_change()
+
+
+@pytest.fixture
+def synthetic_pair():
+    """Two correlated synthetic price histories (no network access needed)."""
+    rng = np.random.default_rng(42)
+    dates = pd.date_range('2020-01-01', periods=2000, freq='h')
+    market = 60000 * np.exp(np.cumsum(rng.normal(0, 0.01, len(dates))))
+    asset = 3000 * np.exp(np.cumsum(rng.normal(0, 0.01, len(dates)))) + 0.05 * market
+    df_asset = pd.DataFrame({'Date': dates, 'Close': asset})
+    df_market = pd.DataFrame({'Date': dates, 'Close': market})
+    return df_asset, df_market
+
+
+class TestCorrelationBetaSynthetic:
+    """Check the vectorized calculations against the pandas reference implementation."""
+    
+    def test_rolling_correlation_matches_pandas(self, data_manager, synthetic_pair):
+        df_asset, df_market = synthetic_pair
+        corr_series = data_manager.calculate_rolling_correlation(df_asset, df_market, window=30)
+        expected = df_asset['Close'].rolling(window=30).corr(df_market['Close'])
+        
+        pd.testing.assert_series_equal(corr_series, expected, check_names=False, atol=1e-8)
+    
+    def test_rolling_beta_matches_pandas(self, data_manager, synthetic_pair):
+        df_asset, df_market = synthetic_pair
+        beta_series = data_manager.calculate_beta_coefficient(df_asset, df_market, window=30)
+        returns_asset = df_asset['Close'].pct_change()
+        returns_market = df_market['Close'].pct_change()
+        expected = returns_asset.rolling(window=30).cov(returns_market) / returns_market.rolling(window=30).var()
+        
+        pd.testing.assert_series_equal(beta_series, expected, check_names=False, atol=1e-8)
+    
+    def test_latest_values_match_rolling_series(self, data_manager, synthetic_pair):
+        df_asset, df_market = synthetic_pair
+        correlation, beta = data_manager.get_latest_correlation_beta(df_asset, df_market, window=30)
+        corr_series = data_manager.calculate_rolling_correlation(df_asset, df_market, window=30)
+        beta_series = data_manager.calculate_beta_coefficient(df_asset, df_market, window=30)
+        
+        assert isinstance(correlation, float)
+        assert isinstance(beta, float)
+        assert correlation == pytest.approx(corr_series.iloc[-1], abs=1e-8)
+        assert beta == pytest.approx(beta_series.iloc[-1], abs=1e-8)
+
+    def test_combined_matches_separate_calculations(self, data_manager, synthetic_pair):
+        df_asset, df_market = synthetic_pair
+        corr_series, beta_series = data_manager.calculate_correlation_and_beta(df_asset, df_market, window=30)
+
+        pd.testing.assert_series_equal(
+            corr_series, data_manager.calculate_rolling_correlation(df_asset, df_market, window=30)
+        )
+        pd.testing.assert_series_equal(
+            beta_series, data_manager.calculate_beta_coefficient(df_asset, df_market, window=30)
+        )
+
+
 class TestCorrelationBeta:
     """Test suite for correlation and beta calculations."""
     
@@ -58,14 +122,19 @@ class TestCorrelationBeta:
         print(f"\n   ✓ Correlation series: {len(corr_series)} values")
         print(f"   ✓ Latest correlation: {latest_corr:.4f}")
     
-    def test_rolling_beta(self, data_manager, eth_data, btc_data):
+    def test_rolling_beta(self, data_manager, eth_data, btc_data, aligned_returns):
         """Test rolling beta coefficient calculation."""
         window = 30
         beta_series = data_manager.calculate_beta_coefficient(eth_data, btc_data, window=window)
+        _, combined_beta = data_manager.calculate_correlation_and_beta(eth_data, btc_data, window=window)
+        returns_eth, returns_btc = aligned_returns
+        expected = returns_eth.rolling(window=window).cov(returns_btc) / returns_btc.rolling(window=window).var()
         
         assert isinstance(beta_series, pd.Series)
         assert len(beta_series) > 0
         assert not beta_series.empty
+        pd.testing.assert_series_equal(combined_beta, expected, check_names=False, atol=1e-8)
+        pd.testing.assert_series_equal(beta_series, combined_beta)
         
         latest_beta = beta_series.iloc[-1]
         assert latest_beta > 0, "Beta should be positive for positively correlated assets"
@@ -88,16 +157,5 @@ class TestCorrelationBeta:
         
         # Print interpretation
         print("\n📝 Interpretation:")
-        if correlation > 0.7:
-            print(f"   🟢 ETH is strongly coupled with BTC (correlation: {correlation:.3f})")
-        elif correlation > 0.3:
-            print(f"   🟡 ETH has moderate correlation with BTC (correlation: {correlation:.3f})")
-        else:
-            print(f"   🔴 ETH is decoupled from BTC (correlation: {correlation:.3f})")
-        
-        if beta > 1:
-            print(f"   📈 ETH is {((beta - 1) * 100):.1f}% more volatile than BTC (beta: {beta:.3f})")
-        elif beta < 1:
-            print(f"   📉 ETH is {((1 - beta) * 100):.1f}% less volatile than BTC (beta: {beta:.3f})")
-        else:
-            print(f"   ➡️  ETH moves in line with BTC (beta: {beta:.3f})")
+        for line in interpret_corr_beta(correlation, beta, 'ETH', 'BTC'):
+            print(f"   {line}")
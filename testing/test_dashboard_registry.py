@@ -0,0 +1,106 @@
+"""
+Pytest tests for dashboard discovery in the DashboardRegistry.
+"""
+import os
+import textwrap
+import types
+
+import pytest
+from dashboard_registry import DashboardRegistry
+
+
+DASHBOARD_SOURCE = '''
+from base_dashboard import BaseDashboard
+
+
+class Labels:
+    display_name = "Helper Labels"
+
+
+class ComputedDashboard(BaseDashboard):
+    display_name = "Computed " + "Dashboard"
+
+    def create_dashboard(self):
+        return None
+'''
+
+
+@pytest.fixture
+def registry(tmp_path):
+    """A registry scanning only a temporary directory with one dashboard file."""
+    (tmp_path / "computed_dashboard.py").write_text(textwrap.dedent(DASHBOARD_SOURCE))
+    registry = DashboardRegistry()
+    registry.dashboard_paths = [tmp_path]
+    yield registry
+    DashboardRegistry.invalidate()
+
+
+class TestDiscovery:
+    """Dashboards are listed under their loaded class's display_name."""
+    
+    def test_listed_under_resolved_display_name(self, registry):
+        dashboards = registry.discover_dashboards()
+        
+        assert list(dashboards) == ["Computed Dashboard"]
+        dashboard_class = registry.get_dashboard("Computed Dashboard")
+        assert dashboard_class.__name__ == "ComputedDashboard"
+        
+        # Later registries are served from the shared caches under the same name
+        fresh = DashboardRegistry()
+        fresh.dashboard_paths = registry.dashboard_paths
+        assert list(fresh.discover_dashboards()) == ["Computed Dashboard"]
+        assert fresh.get_dashboard("Computed Dashboard") is dashboard_class
+    
+    def test_broken_file_is_skipped(self, registry, tmp_path):
+        (tmp_path / "broken_dashboard.py").write_text("raise RuntimeError('boom')\n")
+        
+        assert list(registry.discover_dashboards()) == ["Computed Dashboard"]
+        assert registry.get_dashboard("Broken Dashboard") is None
+    
+    def test_rediscovery_picks_up_added_and_edited_files(self, registry, tmp_path):
+        assert list(registry.discover_dashboards()) == ["Computed Dashboard"]
+        
+        (tmp_path / "another_dashboard.py").write_text("def plot_nothing():\n    return None\n")
+        edited = tmp_path / "computed_dashboard.py"
+        edited.write_text(edited.read_text().replace('"Computed " + "Dashboard"', '"Renamed Dashboard"'))
+        # Make the edit visible even on filesystems with coarse timestamps
+        stat = edited.stat()
+        os.utime(edited, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        os.utime(tmp_path, ns=(stat.st_atime_ns, tmp_path.stat().st_mtime_ns + 1_000_000_000))
+        
+        assert sorted(registry.discover_dashboards()) == ["Another Dashboard", "Renamed Dashboard"]
+
+
+class TestLegacyWrapper:
+    """Wrapped legacy modules run nothing until their deferred panes render."""
+    
+    @pytest.fixture
+    def legacy(self):
+        """A wrapper dashboard around a module whose main() and plot function record calls."""
+        calls = []
+        module = types.ModuleType("legacy_dashboard")
+        
+        def main():
+            calls.append("main")
+        
+        def plot_prices():
+            calls.append("plot_prices")
+        
+        module.main = main
+        module.plot_prices = plot_prices
+        dashboard_class = DashboardRegistry()._create_dashboard_wrapper(
+            module, "legacy_dashboard", "Legacy Dashboard"
+        )
+        return dashboard_class(), calls
+    
+    def test_create_dashboard_calls_nothing(self, legacy):
+        dashboard, calls = legacy
+        layout = dashboard.create_dashboard()
+        
+        assert calls == []
+        deferred = [pane for pane in layout.objects if getattr(pane, 'defer_load', False)]
+        assert len(deferred) == 2
+        
+        for pane in deferred:
+            pane.object()
+        assert calls == ["main", "plot_prices"]
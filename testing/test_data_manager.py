@@ -0,0 +1,137 @@
+"""
+Pytest tests for DataManager helpers that need no network access.
+"""
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+from cache import FileCache
+from data_manager import DataManager
+
+HOUR_MS = 3_600_000
+
+
+@pytest.fixture(scope="module")
+def data_manager():
+    """Create a DataManager instance for testing."""
+    return DataManager()
+
+
+def _hourly_frame(unit):
+    """Forty days of hourly closes ending now, with Date stored at the given resolution."""
+    end = pd.Timestamp(datetime.now(timezone.utc).replace(tzinfo=None)).floor('h')
+    dates = pd.date_range(end=end, periods=40 * 24, freq='h').astype(f'datetime64[{unit}]')
+    return pd.DataFrame({'Date': dates, 'Close': np.arange(len(dates), dtype=float)})
+
+
+class TestFilterByTimeInterval:
+    """The binary-searched period slice must match the boolean-mask reference."""
+    
+    @pytest.mark.parametrize('unit', ['ms', 'us', 'ns'])
+    def test_matches_boolean_mask(self, data_manager, unit):
+        # Klines parse to datetime64[ms]; the cutoff carries microseconds
+        df = _hourly_frame(unit)
+        for interval in ('1W', '2W', '1M'):
+            days = data_manager.config.time_intervals[interval]['days']
+            cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=days)
+            result = data_manager.filter_by_time_interval(df, interval)
+            
+            assert result['Date'].dtype == df['Date'].dtype
+            pd.testing.assert_frame_equal(result, df[df['Date'] >= cutoff])
+    
+    def test_all_time_returns_everything(self, data_manager):
+        df = _hourly_frame('ms')
+        assert len(data_manager.filter_by_time_interval(df, 'All_Time')) == len(df)
+
+
+def _kline(open_time, close='1.5'):
+    """A raw hourly Binance kline row opening at open_time (ms)."""
+    return [open_time, '1', '2', '0.5', close, '10', open_time + HOUR_MS - 1, '0', 5, '0', '0', '0']
+
+
+class FakeKlinesServer:
+    """Stands in for DataManager._request_klines, serving hourly candles up to the open one."""
+    
+    def __init__(self, latest_open):
+        self.latest_open = latest_open
+        self.calls = []
+    
+    def __call__(self, params):
+        self.calls.append(dict(params))
+        limit = params['limit']
+        if 'startTime' in params:
+            opens = range(params['startTime'], self.latest_open + 1, HOUR_MS)
+            return [_kline(t) for t in opens][:limit]
+        opens = range(self.latest_open - (limit - 1) * HOUR_MS, self.latest_open + 1, HOUR_MS)
+        return [_kline(t) for t in opens]
+
+
+class TestIncrementalTopUp:
+    """An expired "latest N candles" entry is topped up from its last candle onwards."""
+    
+    LIMIT = 10
+    
+    @pytest.fixture
+    def manager(self, tmp_path, monkeypatch):
+        """A DataManager with a private klines cache and a fake klines endpoint."""
+        dm = DataManager()
+        dm.klines_cache = FileCache(str(tmp_path), 'klines')
+        latest_open = int(time.time() * 1000) // HOUR_MS * HOUR_MS
+        server = FakeKlinesServer(latest_open)
+        monkeypatch.setattr(dm, '_request_klines', server)
+        DataManager.fetch_historical_data.cache_clear()
+        yield dm, server
+        DataManager.fetch_historical_data.cache_clear()
+    
+    def _seed_expired(self, dm, last_open):
+        """Cache a window of LIMIT candles ending at last_open, written long ago."""
+        key = FileCache.make_key('BTCUSDT', '1h', self.LIMIT, None, None)
+        rows = [_kline(last_open - i * HOUR_MS, close='1.0') for i in reversed(range(self.LIMIT))]
+        dm.klines_cache.directory.mkdir(parents=True, exist_ok=True)
+        with open(dm.klines_cache._path(key), 'w') as f:
+            json.dump({'fetched_at': 0, 'data': rows}, f)
+        return key
+    
+    def test_top_up_merges_new_candles(self, manager):
+        dm, server = manager
+        last_cached = server.latest_open - 3 * HOUR_MS
+        key = self._seed_expired(dm, last_cached)
+        
+        df = dm.fetch_historical_data('BTCUSDT', '1h', limit=self.LIMIT)
+        
+        assert server.calls == [{'symbol': 'BTCUSDT', 'interval': '1h', 'limit': self.LIMIT,
+                                 'startTime': last_cached}]
+        expected_opens = [server.latest_open - i * HOUR_MS for i in reversed(range(self.LIMIT))]
+        assert df['Date'].astype('int64').tolist() == expected_opens
+        _, cached_rows = dm.klines_cache.get_entry(key)
+        assert [row[0] for row in cached_rows] == expected_opens
+    
+    def test_overlapping_candle_is_replaced_not_duplicated(self, manager):
+        dm, server = manager
+        last_cached = server.latest_open - 3 * HOUR_MS
+        self._seed_expired(dm, last_cached)
+        
+        df = dm.fetch_historical_data('BTCUSDT', '1h', limit=self.LIMIT)
+        
+        assert df['Date'].is_unique
+        # The cached (then still open) candle takes the fresh reply's values
+        overlap = df.loc[df['Date'] == pd.Timestamp(last_cached, unit='ms'), 'Close']
+        assert overlap.tolist() == [1.5]
+        assert (df['Close'] == 1.0).sum() == self.LIMIT - 4
+    
+    @pytest.mark.parametrize('hours_behind', [10, 50])
+    def test_falls_back_to_full_refetch(self, manager, hours_behind):
+        dm, server = manager
+        self._seed_expired(dm, server.latest_open - hours_behind * HOUR_MS)
+        
+        df = dm.fetch_historical_data('BTCUSDT', '1h', limit=self.LIMIT)
+        
+        # The top-up reply is cut off at limit rows, so the latest window is refetched
+        assert len(server.calls) == 2
+        assert 'startTime' in server.calls[0] and 'startTime' not in server.calls[1]
+        assert df['Date'].iat[-1] == pd.Timestamp(server.latest_open, unit='ms')
+        assert len(df) == self.LIMIT
+        assert (df['Close'] == 1.5).all()
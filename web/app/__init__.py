@@ -8,18 +8,32 @@ __version__ = "2.0.0"
 __author__ = "Dashboard Team"
 __description__ = "Modular cryptocurrency dashboard with Panel"
 
-# Import main components for easy access
-from .main import create_app, DashboardApp
-from .base_dashboard import BaseDashboard
-from .data_manager import DataManager
-from .figure_factory import FigureFactory
-from .config import AppConfig
-
-__all__ = [
-    'create_app',
-    'DashboardApp', 
-    'BaseDashboard',
-    'DataManager',
-    'FigureFactory',
-    'AppConfig'
-]
+import importlib
+
+# Main components are imported lazily on first attribute access (PEP 562), so
+# importing the package doesn't pull in panel/plotly or build the app.
+_LAZY_IMPORTS = {
+    'create_app': '.main',
+    'DashboardApp': '.main',
+    'BaseDashboard': '.base_dashboard',
+    'DataManager': '.data_manager',
+    'FigureFactory': '.figure_factory',
+    'get_figure_factory': '.figure_factory',
+    'AppConfig': '.config',
+    'get_config': '.config',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,160 @@
+"""
+Caches
+In-memory and persistent on-disk TTL caches for API responses.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable, Mapping, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+class FileCache:
+    """TTL cache that stores JSON-serializable payloads as files on disk.
+
+    Entries live at ``{cache_dir}/{namespace}/{key}.json`` together with the
+    time they were written, so they survive restarts and are shared by every
+    process pointing at the same directory.
+    """
+
+    def __init__(self, cache_dir: str, namespace: str = 'default'):
+        self.directory = Path(cache_dir).expanduser() / namespace
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a stable cache key from request parameters."""
+        return hashlib.md5('|'.join(str(p) for p in parts).encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get_entry(self, key: str) -> Optional[Tuple[float, Any]]:
+        """Return (fetched_at, payload) for key regardless of age, or None if missing."""
+        try:
+            with open(self._path(key), 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry.get('fetched_at', 0), entry.get('data')
+
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[Any]:
+        """Return the cached payload for key, or None if missing or older than ttl seconds."""
+        entry = self.get_entry(key)
+        if entry is None:
+            return None
+
+        fetched_at, data = entry
+        if ttl is not None and time.time() - fetched_at > ttl:
+            return None
+        return data
+
+    def set(self, key: str, data: Any) -> None:
+        """Store a payload under key (written atomically)."""
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump({'fetched_at': time.time(), 'data': data}, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Error writing cache entry %s: %s", path, e)
+            tmp_path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove all entries in this namespace."""
+        if not self.directory.exists():
+            return
+        for path in self.directory.glob('*.json'):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+class MemoryCache:
+    """Thread-safe in-process LRU cache whose entries expire after ttl seconds.
+
+    A different lifetime can be given per entry when it is stored.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (hit, value) for key; expired entries count as misses."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if time.monotonic() > expires_at:
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key (for ttl seconds, default self.ttl), evicting the LRU entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+def ttl_cache(ttl: Union[float, Callable[[Mapping[str, Any]], float]], maxsize: int = 256,
+              should_cache: Optional[Callable[[Any], bool]] = None,
+              bypass: Optional[Callable[[Mapping[str, Any]], bool]] = None):
+    """Memoize a method on its call arguments (excluding self) with a TTL.
+
+    Positional and keyword spellings of the same call share one entry, and the
+    cache is shared by all instances. ttl is either a number of seconds or a
+    function of the bound call arguments (name -> value, defaults applied)
+    returning one. Results rejected by should_cache (e.g. empty responses
+    after an API error) are returned but not stored. Calls for which bypass,
+    given the same bound arguments as a callable ttl, returns True skip the
+    cache entirely. The wrapped function gains a cache_clear() attribute.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        ttl_for = ttl if callable(ttl) else None
+        cache = MemoryCache(0 if ttl_for else ttl, maxsize)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(bound.arguments.items())[1:]
+            if bypass is not None and bypass(dict(key)):
+                return func(self, *args, **kwargs)
+
+            hit, value = cache.get(key)
+            if hit:
+                return value
+
+            value = func(self, *args, **kwargs)
+            if should_cache is None or should_cache(value):
+                cache.set(key, value, ttl_for(dict(key)) if ttl_for else None)
+            return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
@@ -3,6 +3,30 @@ Configuration and Styling
 Application-wide configuration and styling constants.
 """
 
+import functools
+import os
+
+# Cryptocurrency (primary, secondary) colors for consistency
+_CRYPTO_COLOR_PAIRS = {
+    'BTC': ('orange', 'gold'),
+    'ETH': ('mediumpurple', 'plum'),
+    'BNB': ('indianred', 'lightsalmon'),
+    'ADA': ('royalblue', 'lightblue'),
+    'DOT': ('hotpink', 'pink'),
+    'DOGE': ('gold', 'goldenrod'),
+    'LTC': ('silver', 'gray'),
+    'XRP': ('forestgreen', 'darkgreen'),
+    'SOL': ('lightseagreen', 'mediumpurple'),
+    'LINK': ('lightskyblue', 'dodgerblue'),
+    'TRX': ('crimson', 'tomato'),
+    'UNI': ('palevioletred', 'mediumvioletred'),
+    'XLM': ('steelblue', 'darkblue'),
+    'SHIB': ('sandybrown', 'peru'),
+    'HBAR': ('darkslategrey', 'black'),
+}
+_COLOR_TYPE_INDEX = {'primary': 0, 'secondary': 1}
+
+
 class AppConfig:
     """Application configuration and styling."""
     
@@ -46,70 +70,6 @@ class AppConfig:
         }
         
         
-        # Cryptocurrency colors for consistency
-        self.crypto_colors = {
-            'BTC': {
-                'primary': 'orange',
-                'secondary': 'gold'
-            },
-            'ETH': {
-                'primary': 'mediumpurple',
-                'secondary': 'plum'
-            },
-            'BNB': {
-                'primary': 'indianred',
-                'secondary': 'lightsalmon'
-            },
-            'ADA': {
-                'primary': 'royalblue',
-                'secondary': 'lightblue'
-            },
-            'DOT': {
-                'primary': 'hotpink',
-                'secondary': 'pink'
-            },
-            'DOGE': {
-                'primary': 'gold',
-                'secondary': 'goldenrod'
-            },
-            'LTC': {
-                'primary': 'silver',
-                'secondary': 'gray'
-            },
-            'XRP': {
-                'primary': 'forestgreen',
-                'secondary': 'darkgreen'
-            },
-            'SOL': {
-                'primary': 'lightseagreen',
-                'secondary': 'mediumpurple'
-            },
-            'LINK': {
-                'primary': 'lightskyblue',
-                'secondary': 'dodgerblue'
-            },
-            'TRX': {
-                'primary': 'crimson',
-                'secondary': 'tomato'
-            },
-            'UNI': {
-                'primary': 'palevioletred',
-                'secondary': 'mediumvioletred'
-            },
-            'XLM': {
-                'primary': 'steelblue',
-                'secondary': 'darkblue'
-            },
-            'SHIB': {
-                'primary': 'sandybrown',
-                'secondary': 'peru'
-            },
-            'HBAR': {
-                'primary': 'darkslategrey',
-                'secondary': 'black'
-            }
-        }
-        
         # Default time intervals
         self.time_intervals = {
             'All_Time': {'days': 'max', 'interval': 'daily'},
@@ -127,14 +87,29 @@ class AppConfig:
         # API settings
         self.api_config = {
             'cache_timeout': 300,  # 5 minutes
+            # Longer-lived klines per interval; in combined data, daily/weekly candles only
+            # cover history older than the hourly window, so they change far less often
+            'interval_cache_timeouts': {'1d': 1800, '1w': 3600},
+            'price_cache_timeout': 5,  # seconds; current prices go stale quickly
+            'cache_dir': os.getenv('KRYPTO_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.krypto_cache')),
             'max_retries': 3,
             'timeout': 30
         }
     
     def get_crypto_color(self, symbol: str, color_type: str = 'primary') -> str:
         """Get color for a cryptocurrency symbol."""
-        return self.crypto_colors.get(symbol, {}).get(color_type, 'gray')
+        pair = _CRYPTO_COLOR_PAIRS.get(symbol)
+        index = _COLOR_TYPE_INDEX.get(color_type)
+        if pair is None or index is None:
+            return 'gray'
+        return pair[index]
     
     def get_plotly_template(self) -> str:
         """Get the default Plotly template."""
         return 'plotly_white'
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> AppConfig:
+    """Return the shared AppConfig instance (built once per process)."""
+    return AppConfig()
@@ -5,15 +5,22 @@ Manages discovery and loading of dashboard modules.
 
 import importlib.util
 import inspect
+import os
 import sys
 from pathlib import Path
-from typing import Dict, Type
+from typing import ClassVar, Dict, List, Tuple, Type
 
 from base_dashboard import BaseDashboard
 
+
 class DashboardRegistry:
     """Registry for discovering and managing dashboard modules."""
     
+    # Loaded dashboard classes keyed by file path, with the file mtime they were loaded at
+    _module_cache: ClassVar[Dict[Path, Tuple[int, Type[BaseDashboard]]]] = {}
+    # Dashboard files per directory, with the directory mtime they were listed at
+    _dir_cache: ClassVar[Dict[Path, Tuple[int, List[Path]]]] = {}
+    
     def __init__(self):
         self.dashboards: Dict[str, Type[BaseDashboard]] = {}
         self.dashboard_paths = [
@@ -21,27 +28,70 @@ class DashboardRegistry:
             Path(__file__).parent.parent / "example_dashboards" / "simple"
         ]
     
-    def discover_dashboards(self):
-        """Discover all available dashboard modules."""
+    def discover_dashboards(self) -> Dict[str, Type[BaseDashboard]]:
+        """Discover all available dashboard modules.
+        
+        Directory listings and imported modules are cached per process and
+        reused while the directory's / file's modification time is unchanged,
+        so added, removed and edited dashboards are picked up on the next call.
+        """
         self.dashboards.clear()
         
         for dashboard_dir in self.dashboard_paths:
             if dashboard_dir.exists():
                 self._scan_directory(dashboard_dir)
+        
+        return self.dashboards
+    
+    @classmethod
+    def invalidate(cls):
+        """Drop cached listings and modules, forcing a full rescan and re-import."""
+        cls._dir_cache.clear()
+        cls._module_cache.clear()
     
     def _scan_directory(self, directory: Path):
-        """Scan a directory for dashboard Python files."""
-        for file_path in directory.glob("*.py"):
-            if file_path.name.startswith('_'):
-                continue
-                
+        """Scan a directory for dashboard Python files.
+        
+        Each file is registered under its dashboard class's display_name; files
+        that fail to import are reported and skipped.
+        """
+        for file_path in self._list_dashboard_files(directory):
             try:
-                self._load_dashboard_module(file_path)
+                dashboard_class = self._get_dashboard_class(file_path)
             except Exception as e:
                 print(f"Error loading dashboard from {file_path}: {e}")
+                continue
+            self.dashboards[dashboard_class.display_name] = dashboard_class
+    
+    def _list_dashboard_files(self, directory: Path) -> List[Path]:
+        """Dashboard files in directory, re-listed only when its modification time
+        (which changes when files are added, removed or renamed) changes."""
+        dir_mtime = directory.stat().st_mtime_ns
+        cached = self._dir_cache.get(directory)
+        if cached is not None and cached[0] == dir_mtime:
+            return cached[1]
+        
+        with os.scandir(directory) as entries:
+            files = sorted(
+                Path(entry.path) for entry in entries
+                if not entry.name.startswith('_') and entry.name.endswith('.py') and entry.is_file()
+            )
+        self._dir_cache[directory] = (dir_mtime, files)
+        return files
+    
+    def _get_dashboard_class(self, file_path: Path) -> Type[BaseDashboard]:
+        """Return the dashboard class defined in file_path, importing it if new or changed."""
+        mtime = file_path.stat().st_mtime_ns
+        cached = self._module_cache.get(file_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        dashboard_class = self._load_dashboard_module(file_path)
+        self._module_cache[file_path] = (mtime, dashboard_class)
+        return dashboard_class
     
-    def _load_dashboard_module(self, file_path: Path):
-        """Load a dashboard module and extract dashboard classes."""
+    def _load_dashboard_module(self, file_path: Path) -> Type[BaseDashboard]:
+        """Load a dashboard module and return its dashboard class."""
         module_name = file_path.stem
         
         # Ensure the app directory is on sys.path so dashboards can import shared modules
@@ -63,68 +113,87 @@ class DashboardRegistry:
         dashboard_class = None
         
         # First, look for classes that inherit from BaseDashboard
-        for name, obj in inspect.getmembers(module, inspect.isclass):
-            if issubclass(obj, BaseDashboard) and obj != BaseDashboard:
+        for obj in vars(module).values():
+            if isinstance(obj, type) and issubclass(obj, BaseDashboard) and obj is not BaseDashboard:
                 dashboard_class = obj
                 break
         
-        # If no BaseDashboard subclass found, create a wrapper
+        # If no BaseDashboard subclass found, create a wrapper named after the module
         if not dashboard_class:
-            dashboard_class = self._create_dashboard_wrapper(module, module_name)
+            dashboard_class = self._create_dashboard_wrapper(
+                module, module_name, module_name.replace('_', ' ').title()
+            )
         
-        if dashboard_class:
-            # Use the class name or module name as the dashboard name
-            dashboard_name = getattr(dashboard_class, 'display_name', module_name.replace('_', ' ').title())
-            self.dashboards[dashboard_name] = dashboard_class
+        return dashboard_class
     
-    def _create_dashboard_wrapper(self, module, module_name):
+    def _create_dashboard_wrapper(self, module, module_name, dashboard_name):
         """Create a wrapper class for legacy dashboard modules."""
         
+        # Find the module's plotting functions once, not on every instantiation
+        plot_functions = sorted(
+            (name, obj) for name, obj in vars(module).items()
+            if inspect.isfunction(obj) and (name.startswith('plot_') or 'plot' in name.lower())
+        )
+        
+        # Static Markdown is built once per class instead of on every render
+        header_md = f"## {dashboard_name}"
+        func_list_md = None
+        if plot_functions:
+            func_list = "\\n".join([f"- {name}" for name, _ in plot_functions])
+            func_list_md = f"**Available plotting functions:**\\n{func_list}"
+        
         class DynamicDashboard(BaseDashboard):
-            display_name = module_name.replace('_', ' ').title()
+            display_name = dashboard_name
             description = f"Dashboard from {module_name}.py"
             version = "1.1"
             author = "Auto-generated & modified by kuranez"
+            _PLOT_FUNCS = plot_functions
+            _HEADER_MD = header_md
+            _FUNC_LIST_MD = func_list_md
             
             def __init__(self):
                 super().__init__()
                 self.module = module
+                self.plot_functions = self._PLOT_FUNCS
+            
+            @staticmethod
+            def _deferred_plot(func_name, func):
+                """Wrap a plotting function so it runs after the page has rendered."""
+                import panel as pn
                 
-                # Try to find key functions in the module
-                self.plot_functions = []
-                for name, obj in inspect.getmembers(module, inspect.isfunction):
-                    if name.startswith('plot_') or 'plot' in name.lower():
-                        self.plot_functions.append((name, obj))
+                def render():
+                    try:
+                        result = func()
+                    except Exception as e:
+                        return pn.pane.Markdown(f"Error in {func_name}: {e}")
+                    return result if result is not None else pn.Spacer(height=0)
+                
+                return pn.panel(render, defer_load=True, loading_indicator=True)
             
             def create_dashboard(self):
                 """Create dashboard from module functions."""
                 import panel as pn
                 
                 components = []
-                components.append(pn.pane.Markdown(f"## {self.display_name}"))
+                components.append(pn.pane.Markdown(self._HEADER_MD))
                 
-                # If the module has a main function, try to extract plots from it
+                # A module's main() is deferred like the plots; its return value is ignored
                 if hasattr(self.module, 'main'):
-                    try:
+                    def run_main():
                         self.module.main()
-                    except Exception as e:
-                        components.append(pn.pane.Markdown(f"Error executing main: {e}"))
+                    components.append(self._deferred_plot('main', run_main))
                 
-                # Execute and capture plotting functions
-                for func_name, func in self.plot_functions:
-                    try:
-                        result = func()
-                        if result is not None:
-                            components.append(result)
-                    except Exception as e:
-                        components.append(pn.pane.Markdown(f"Error in {func_name}: {e}"))
+                # Plotting functions are evaluated one by one once the page is loaded
+                components.extend(
+                    self._deferred_plot(func_name, func) for func_name, func in self.plot_functions
+                )
                 
                 # Show available functions
-                if self.plot_functions:
-                    func_list = "\\n".join([f"- {name}" for name, _ in self.plot_functions])
-                    components.append(pn.pane.Markdown(f"**Available plotting functions:**\\n{func_list}"))
+                if self._FUNC_LIST_MD:
+                    components.append(pn.pane.Markdown(self._FUNC_LIST_MD))
                 
-                return pn.Column(*components)
+                # Hand the list over as-is rather than star-unpacking it
+                return pn.Column(objects=components)
         
         return DynamicDashboard
     
@@ -3,51 +3,212 @@ Data Manager
 Handles data fetching, caching, and processing for dashboards.
 """
 
+import functools
+import json
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
-import panel as pn
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from cache import FileCache, ttl_cache
+from config import get_config
+
+_API_CONFIG = get_config().api_config
+
+
+_INTERVAL_UNIT_MS = {'m': 60_000, 'h': 3_600_000, 'd': 86_400_000, 'w': 604_800_000}
+
+
+def _ttl_for_interval(interval: str) -> float:
+    """Cache lifetime in seconds for klines of the given interval."""
+    return _API_CONFIG['interval_cache_timeouts'].get(interval, _API_CONFIG['cache_timeout'])
+
+
+def _interval_ms(interval: str) -> Optional[int]:
+    """Candle length in milliseconds for a Binance interval ('15m', '1h', '1w'), or None ('1M')."""
+    unit_ms = _INTERVAL_UNIT_MS.get(interval[-1:])
+    if unit_ms is None or not interval[:-1].isdigit():
+        return None
+    return int(interval[:-1]) * unit_ms
+
+
+def _reaches_current_candle(rows: list, interval: str, limit: int) -> bool:
+    """Whether a startTime-anchored klines reply runs up to the currently open candle.
+    
+    A full reply may have been cut off at limit rows, and a reply whose newest
+    candle was followed by another one that has already opened is behind.
+    """
+    if not rows or len(rows) >= limit:
+        return False
+    step = _interval_ms(interval)
+    return step is None or rows[-1][0] + step > time.time() * 1000
+
+
+@functools.lru_cache(maxsize=1)
+def _load_api_key() -> Optional[str]:
+    """Load keys.env (first match) once per process and return the Binance API key."""
+    # Try to load from multiple possible locations
+    env_paths = [
+        'keys.env',
+        '../keys.env',
+        '../../keys.env'
+    ]
+    
+    for path in env_paths:
+        if os.path.exists(path):
+            load_dotenv(path)
+            break
+    
+    return os.getenv('BINANCE_API_KEY')
+
+
+def _rolling_sums(x: np.ndarray, y: np.ndarray, window: int) -> Tuple[np.ndarray, ...]:
+    """Rolling window sums of x, y, x*y, x*x and y*y (NaN until the window is full).
+    
+    Both series are centred on their mean first (the correlation and beta ratios are
+    shift-invariant, and centring keeps the sums well-conditioned for large prices).
+    All five moments are accumulated in a single prefix-sum pass over one float64
+    work buffer that is filled in place; each window sum is the running total with
+    the outgoing element dropped. Windows containing a NaN in either series are NaN,
+    matching pandas' rolling semantics.
+    """
+    n = len(x)
+    out = np.full((5, n), np.nan)
+    if n < window:
+        return tuple(out)
+    
+    missing = np.isnan(x) | np.isnan(y)
+    
+    # Rows: x, y, x*y, x*x, y*y, missing-count; column 0 is the zero prefix
+    prefix = np.empty((6, n + 1), dtype=np.float64)
+    prefix[:, 0] = 0.0
+    px, py, pxy, pxx, pyy, pmissing = prefix[:, 1:]
+    np.subtract(x, np.nanmean(x), out=px)
+    np.subtract(y, np.nanmean(y), out=py)
+    px[missing] = 0.0
+    py[missing] = 0.0
+    np.multiply(px, py, out=pxy)
+    np.multiply(px, px, out=pxx)
+    np.multiply(py, py, out=pyy)
+    pmissing[:] = missing
+    np.cumsum(prefix[:, 1:], axis=1, out=prefix[:, 1:])
+    
+    windowed = out[:, window - 1:]
+    np.subtract(prefix[:5, window:], prefix[:5, :-window], out=windowed)
+    windowed[:, prefix[5, window:] > prefix[5, :-window]] = np.nan
+    return tuple(out)
+
+
+def _simple_moving_averages(values: np.ndarray, windows: Tuple[int, ...]) -> List[np.ndarray]:
+    """Simple moving averages for several window sizes from one prefix-sum pass.
+    
+    Matches pandas' rolling(window).mean(): NaN until the window is full and for
+    any window containing a NaN.
+    """
+    n = len(values)
+    if n < min(windows):
+        # No window fits (e.g. a 1W period of hourly candles): skip the prefix pass
+        return [np.full(n, np.nan) for _ in windows]
+    
+    missing = np.isnan(values)
+    prefix = np.zeros((2, n + 1))
+    np.cumsum(np.where(missing, 0.0, values), out=prefix[0, 1:])
+    np.cumsum(missing, out=prefix[1, 1:])
+    
+    averages = []
+    for window in windows:
+        sma = np.full(n, np.nan)
+        if n >= window:
+            window_sums = prefix[:, window:] - prefix[:, :-window]
+            sma[window - 1:] = np.where(window_sums[1] == 0, window_sums[0] / window, np.nan)
+        averages.append(sma)
+    return averages
+
+
+def _rolling_corr(x: np.ndarray, y: np.ndarray, window: int) -> np.ndarray:
+    """Rolling Pearson correlation via the sum-form identity."""
+    sx, sy, sxy, sxx, syy = _rolling_sums(x, y, window)
+    n = float(window)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        var_x = n * sxx - sx * sx
+        var_y = n * syy - sy * sy
+        denom = np.sqrt(var_x * var_y)
+        corr = np.where(denom > 0, (n * sxy - sx * sy) / denom, np.nan)
+    return np.clip(corr, -1.0, 1.0)
+
+
+def _rolling_beta(x: np.ndarray, y: np.ndarray, window: int) -> np.ndarray:
+    """Rolling beta of x against y: Cov(x, y) / Var(y), via the sum-form identity."""
+    sx, sy, sxy, _, syy = _rolling_sums(x, y, window)
+    n = float(window)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        var_y = n * syy - sy * sy
+        return np.where(var_y > 0, (n * sxy - sx * sy) / var_y, np.nan)
 
-from config import AppConfig
 
 class DataManager:
     """Manages data fetching and caching for cryptocurrency data."""
     
     def __init__(self):
-        self.config = AppConfig()
+        self.config = get_config()
         self._setup_api()
+        self.klines_cache = FileCache(self.config.api_config['cache_dir'], 'klines')
         
     def _setup_api(self):
         """Setup API configuration."""
-        # Try to load from multiple possible locations
-        env_paths = [
-            'keys.env',
-            '../keys.env',
-            '../../keys.env'
-        ]
-        
-        for path in env_paths:
-            if os.path.exists(path):
-                load_dotenv(path)
-                break
-        
-        self.api_key = os.getenv('BINANCE_API_KEY')
+        self.api_key = _load_api_key()
         self.base_url = 'https://api.binance.us/api/v3'
         self.klines_url = f'{self.base_url}/klines'
         self.price_url = f'{self.base_url}/ticker/price'
+        
+        # One pooled keep-alive session so concurrent fetches reuse TCP/TLS connections;
+        # rate-limit and transient server errors are retried with backoff
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        )
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry))
+        if self.api_key:
+            self.session.headers['X-MBX-APIKEY'] = self.api_key
     
-    @pn.cache
+    @ttl_cache(ttl=lambda args: _ttl_for_interval(args['interval']), maxsize=256,
+               should_cache=lambda df: not df.empty, bypass=lambda args: not args['cache'])
     def fetch_historical_data(self, 
                              symbol: str = 'BTCUSDT', 
                              interval: str = '1h',  # Changed from '1d' to '1h' for more data points
                              start_time: Optional[int] = None, 
                              end_time: Optional[int] = None, 
-                             limit: int = 1000) -> pd.DataFrame:  # Binance max is 1000
-        """Fetch historical data for a given symbol from Binance API."""
+                             limit: int = 1000,  # Binance max is 1000
+                             cache: bool = True) -> pd.DataFrame:
+        """Fetch historical data for a given symbol from Binance API.
+        
+        Responses are persisted in the on-disk klines cache for
+        ``api_config['cache_timeout']`` seconds (or the interval's entry in
+        ``api_config['interval_cache_timeouts']``); pass ``cache=False`` to bypass both
+        it and the in-memory memo.
+        Once a cached "latest N candles" window expires, only the candles from its
+        last (still open) one onwards are requested and merged into it; if that
+        reply does not reach the current candle, the latest window is refetched.
+        """
+        cache_key = FileCache.make_key(symbol, interval, limit, start_time, end_time)
+        cached_rows = None
+        if cache:
+            entry = self.klines_cache.get_entry(cache_key)
+            if entry is not None:
+                fetched_at, cached_rows = entry
+                if time.time() - fetched_at <= _ttl_for_interval(interval):
+                    return self._parse_klines(cached_rows, symbol)
         
         params = {
             'symbol': symbol,
@@ -59,44 +220,32 @@ class DataManager:
             params['startTime'] = start_time
         if end_time:
             params['endTime'] = end_time
-            
-        headers = {}
-        if self.api_key:
-            headers['X-MBX-APIKEY'] = self.api_key
         
-        try:
-            response = requests.get(
-                self.klines_url, 
-                headers=headers, 
-                params=params,
-                timeout=self.config.api_config['timeout']
-            )
+        # Closed candles never change, so a stale window is topped up rather than refetched
+        incremental = bool(cached_rows) and not start_time and not end_time
+        if incremental:
+            params['startTime'] = cached_rows[-1][0]
             
-            if response.status_code != 200:
-                print(f"Error {response.status_code}: {response.text}")
+        try:
+            data = self._request_klines(params)
+            if data is None:
                 return pd.DataFrame()
-
-            data = response.json()
-            df = pd.DataFrame(data, columns=[
-                'Open Time', 'Open', 'High', 'Low', 'Close', 'Volume',
-                'Close Time', 'Quote Asset Volume', 'Number of Trades',
-                'Taker Buy Base Asset Volume', 'Taker Buy Quote Asset Volume', 'Ignore'
-            ])
             
-            # Process the data
-            df['Date'] = pd.to_datetime(df['Open Time'], unit='ms')
-            df = df.drop(columns=[
-                'Open Time', 'Close Time', 'Quote Asset Volume',
-                'Taker Buy Base Asset Volume', 'Taker Buy Quote Asset Volume', 'Ignore'
-            ])
-            
-            # Convert price columns to float
-            price_columns = ['Open', 'High', 'Low', 'Close']
-            for col in price_columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+            if incremental:
+                if _reaches_current_candle(data, interval, limit):
+                    first_open = data[0][0]
+                    data = ([row for row in cached_rows if row[0] < first_open] + data)[-limit:]
+                else:
+                    # More candles passed than one reply holds: refetch the latest window
+                    del params['startTime']
+                    data = self._request_klines(params)
+                    if data is None:
+                        return pd.DataFrame()
+            df = self._parse_klines(data, symbol)
             
-            df['Volume'] = pd.to_numeric(df['Volume'], errors='coerce')
-            df['Symbol'] = symbol[:-4] if symbol.endswith('USDT') else symbol
+            # An empty reply never replaces previously cached rows
+            if cache and data:
+                self.klines_cache.set(cache_key, data)
             
             return df
             
@@ -104,26 +253,98 @@ class DataManager:
             print(f"Error fetching data for {symbol}: {e}")
             return pd.DataFrame()
     
-    @pn.cache
+    def _request_klines(self, params: dict) -> Optional[list]:
+        """GET a raw klines payload; None (after logging the error) on a non-200 response."""
+        response = self.session.get(
+            self.klines_url, 
+            params=params,
+            timeout=self.config.api_config['timeout']
+        )
+        
+        if response.status_code != 200:
+            print(f"Error {response.status_code}: {response.text}")
+            return None
+        return response.json()
+    
+    def _parse_klines(self, data: list, symbol: str) -> pd.DataFrame:
+        """Convert a raw Binance klines payload into a price DataFrame.
+        
+        Only the used fields are sliced out of the payload (open time, OHLCV and
+        trade count); the remaining six kline fields are never materialized.
+        """
+        if not data:
+            return pd.DataFrame(columns=['Date', 'Open', 'High', 'Low', 'Close', 'Volume', 'Number of Trades', 'Symbol'])
+        
+        rows = np.asarray(data, dtype=object)
+        # Prices and volume arrive as strings: convert the OHLCV block in one typed cast,
+        # falling back to per-column coercion (malformed values -> NaN) only if that fails
+        try:
+            ohlcv = rows[:, 1:6].astype(np.float64)
+        except (TypeError, ValueError):
+            ohlcv = np.column_stack([pd.to_numeric(rows[:, i], errors='coerce') for i in range(1, 6)])
+        
+        df = pd.DataFrame({
+            'Date': pd.to_datetime(rows[:, 0].astype(np.int64), unit='ms'),
+            'Open': ohlcv[:, 0],
+            'High': ohlcv[:, 1],
+            'Low': ohlcv[:, 2],
+            'Close': ohlcv[:, 3],
+            'Volume': ohlcv[:, 4],
+            'Number of Trades': rows[:, 8].astype(np.int64),
+        })
+        # One repeated label per frame: store it as a categorical (int8 codes)
+        short_symbol = symbol[:-4] if symbol.endswith('USDT') else symbol
+        df['Symbol'] = pd.Categorical.from_codes(np.zeros(len(df), dtype=np.int8), categories=[short_symbol])
+        
+        return df
+    
     def fetch_current_price(self, symbol: str) -> float:
-        """Fetch the current price for a given symbol from Binance API."""
+        """Fetch the current price for a given symbol from Binance API (0.0 on error)."""
+        return self.fetch_current_prices([symbol]).get(symbol, 0.0)
+    
+    def fetch_current_prices(self, symbols: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """Fetch current prices for several symbols with a single API request.
+        
+        Args:
+            symbols: Trading pair symbols (e.g., ['BTCUSDT', 'ETHUSDT']); None fetches every symbol
+        
+        Returns:
+            Dictionary mapping symbol to price (empty on error)
+        """
+        return self._fetch_prices(None if symbols is None else tuple(symbols))
+    
+    @ttl_cache(ttl=_API_CONFIG['price_cache_timeout'], maxsize=64, should_cache=bool)
+    def _fetch_prices(self, symbols: Optional[Tuple[str, ...]]) -> Dict[str, float]:
+        """Fetch /ticker/price for a tuple of symbols (hashable, so results can be memoized)."""
+        params = None
+        if symbols is not None:
+            if not symbols:
+                return {}
+            params = {'symbols': json.dumps(list(symbols), separators=(',', ':'))}
         
         try:
-            response = requests.get(
-                f"{self.price_url}?symbol={symbol}",
+            response = self.session.get(
+                self.price_url,
+                params=params,
                 timeout=self.config.api_config['timeout']
             )
             
             if response.status_code == 200:
-                data = response.json()
-                return float(data.get('price', 0))
+                return {item['symbol']: float(item['price']) for item in response.json()}
             else:
-                print(f"Error fetching current price for {symbol}: {response.status_code}")
-                return 0.0
+                print(f"Error fetching current prices: {response.status_code}")
+                return {}
                 
         except Exception as e:
-            print(f"Error fetching current price for {symbol}: {e}")
-            return 0.0
+            print(f"Error fetching current prices: {e}")
+            return {}
+    
+    def cache_clear(self):
+        """Drop cached klines and prices (in memory and on disk) to force fresh API calls."""
+        DataManager.fetch_historical_data.cache_clear()
+        DataManager.fetch_combined_data.cache_clear()
+        DataManager._fetch_prices.cache_clear()
+        self.klines_cache.clear()
     
     def fetch_smart_data(self, symbol: str, time_period: str = '1Y') -> pd.DataFrame:
         """Fetch historical data with smart interval selection based on time period.
@@ -162,15 +383,18 @@ class DataManager:
             df = self.fetch_historical_data(symbol=symbol, interval='1h', limit=1000)
             return df
     
+    @ttl_cache(ttl=_API_CONFIG['cache_timeout'], maxsize=32, should_cache=lambda df: not df.empty)
     def fetch_combined_data(self, symbol: str) -> pd.DataFrame:
         """Fetch multi-timeframe data and combine them intelligently.
         
-        Fetches three timeframes for comprehensive coverage:
+        Fetches three timeframes concurrently for comprehensive coverage:
         - Weekly data: 1000 weeks (~19 years) for long-term history
         - Daily data: 1000 days (~2.7 years) for medium-term
         - Hourly data: 1000 hours (~41 days) for recent high-resolution
         
-        Combines them without overlap for optimal chart performance.
+        Combines them without overlap for optimal chart performance. The result is
+        memoized for ``api_config['cache_timeout']`` seconds and shared between
+        callers, so copy it before modifying it in place.
         
         Args:
             symbol: Trading pair symbol (e.g., 'BTCUSDT')
@@ -179,47 +403,36 @@ class DataManager:
             DataFrame with combined historical price data across all timeframes
         """
         try:
-            # Fetch hourly data for recent period (1000 hours ~ 41 days)
-            df_hourly = self.fetch_historical_data(symbol=symbol, interval='1h', limit=1000)
-            
-            # Fetch daily data for medium-term history (1000 days ~ 2.7 years)
-            df_daily = self.fetch_historical_data(symbol=symbol, interval='1d', limit=1000)
-            
-            # Fetch weekly data for long-term history (1000 weeks ~ 19 years)
-            df_weekly = self.fetch_historical_data(symbol=symbol, interval='1w', limit=1000)
+            # Fetch the three timeframes concurrently so the network round trips overlap:
+            # hourly for the recent period (1000 hours ~ 41 days), daily for medium-term
+            # history (1000 days ~ 2.7 years) and weekly for long-term history (~19 years)
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                df_hourly, df_daily, df_weekly = executor.map(
+                    lambda interval: self.fetch_historical_data(symbol=symbol, interval=interval, limit=1000),
+                    ('1h', '1d', '1w')
+                )
             
             # Handle empty data cases
             if df_hourly.empty and df_daily.empty and df_weekly.empty:
                 return pd.DataFrame()
             
-            # Start with weekly data as the base
-            combined = df_weekly.copy() if not df_weekly.empty else pd.DataFrame()
-            
-            # Add daily data (excluding overlap with hourly)
-            if not df_daily.empty:
-                if not df_hourly.empty:
-                    hourly_start = df_hourly['Date'].min()
-                    df_daily_filtered = df_daily[df_daily['Date'] < hourly_start].copy()
-                else:
-                    df_daily_filtered = df_daily.copy()
-                
-                # Remove daily data that overlaps with weekly
-                if not combined.empty:
-                    daily_start = df_daily_filtered['Date'].min()
-                    combined = combined[combined['Date'] < daily_start].copy()
-                
-                if not df_daily_filtered.empty:
-                    combined = pd.concat([combined, df_daily_filtered], ignore_index=True)
-            
-            # Add hourly data (most recent, no overlap)
-            if not df_hourly.empty:
-                combined = pd.concat([combined, df_hourly], ignore_index=True)
+            # Each timeframe only covers the span before the next finer one starts:
+            # daily up to the first hourly candle, weekly up to the first daily one.
+            # Frames are sorted by Date, so the cut points are binary searches and the
+            # slices are disjoint and already in order (no sort/dedupe needed).
+            parts = [df_hourly] if not df_hourly.empty else []
+            cutoff = df_hourly['Date'].iat[0] if not df_hourly.empty else None
+            for df in (df_daily, df_weekly):
+                if df.empty:
+                    continue
+                if cutoff is not None:
+                    df = df.iloc[:df['Date'].searchsorted(cutoff, side='left')]
+                if not df.empty:
+                    parts.append(df)
+                    cutoff = df['Date'].iat[0]
             
-            # Sort and clean
-            if not combined.empty:
-                combined = combined.sort_values('Date').reset_index(drop=True)
-                # Remove any duplicate dates (keep last which is more granular)
-                combined = combined.drop_duplicates(subset=['Date'], keep='last').reset_index(drop=True)
+            # One concat (and one allocation) for the whole combined frame
+            combined = pd.concat(parts[::-1], ignore_index=True)
             
             return combined
                 
@@ -227,18 +440,39 @@ class DataManager:
             print(f"Error fetching combined data for {symbol}: {e}")
             return pd.DataFrame()
     
+    def fetch_combined_data_batch(self, symbols: List[str], max_workers: int = 8) -> Dict[str, pd.DataFrame]:
+        """Fetch combined multi-timeframe data for several symbols concurrently.
+        
+        The requests are network-bound, so running them on a thread pool makes
+        the total wait roughly that of the slowest symbol instead of the sum.
+        
+        Args:
+            symbols: Trading pair symbols (e.g., ['BTCUSDT', 'ETHUSDT'])
+            max_workers: Maximum number of concurrent fetches (default 8)
+        
+        Returns:
+            Dictionary mapping each symbol to its combined DataFrame (empty on failure)
+        """
+        if not symbols:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(symbols))) as executor:
+            return dict(zip(symbols, executor.map(self.fetch_combined_data, symbols)))
+    
     def add_technical_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """Add technical indicators (SMAs and EMAs) to the DataFrame.
         
         This is the single source of truth for all moving average calculations.
+        The input frame is not modified; the returned frame shares its price data.
         """
         if df.empty:
             return df
             
-        df = df.copy()
-        # Simple Moving Averages
-        df['SMA_50'] = df['Close'].rolling(window=50).mean()
-        df['SMA_200'] = df['Close'].rolling(window=200).mean()
+        # Shallow copy: only the new indicator columns are allocated
+        df = df.copy(deep=False)
+        close = df['Close'].to_numpy(dtype=np.float64)
+        # Simple Moving Averages (both windows from one pass over Close)
+        df['SMA_50'], df['SMA_200'] = _simple_moving_averages(close, (50, 200))
         # Exponential Moving Averages
         df['EMA_50'] = df['Close'].ewm(span=50, adjust=False).mean()
         df['EMA_200'] = df['Close'].ewm(span=200, adjust=False).mean()
@@ -261,24 +495,27 @@ class DataManager:
                             Higher values = more conservative (fewer removals)
         
         Returns:
-            Filtered DataFrame with spike outliers removed
+            Filtered DataFrame with spike outliers removed (always a copy: callers
+            pass the shared fetch_combined_data result and add columns to this one)
             
         Example:
             # Remove extreme price spikes (likely data errors)
             clean_df = data_manager.filter_price_spikes(df, spike_threshold=3.5)
         """
         if df.empty or 'High' not in df.columns:
-            return df
+            return df.copy()
         
         df_clean = df.copy()
         
         # Calculate rolling statistics for High prices (30-period window)
         window = min(30, len(df) // 10)  # Adaptive window size
         if window < 3:
-            return df  # Not enough data for filtering
+            return df_clean  # Not enough data for filtering
         
-        rolling_median = df_clean['High'].rolling(window=window, center=True).median()
-        rolling_std = df_clean['High'].rolling(window=window, center=True).std()
+        # Both statistics use pandas' built-in (Cython) rolling aggregations on one window object
+        rolling_high = df_clean['High'].rolling(window=window, center=True)
+        rolling_median = rolling_high.median()
+        rolling_std = rolling_high.std()
         
         # Identify spikes: points that deviate more than threshold * std from median
         deviation = abs(df_clean['High'] - rolling_median)
@@ -316,10 +553,12 @@ class DataManager:
         if df.empty or column_name not in df.columns:
             return df
         
-        lower_bound = df[column_name].quantile(lower_percentile / 100)
-        upper_bound = df[column_name].quantile(upper_percentile / 100)
+        # Both bounds from one partial sort (NaNs skipped, as in Series.quantile)
+        values = df[column_name].to_numpy(dtype=np.float64)
+        lower_bound, upper_bound = np.nanquantile(values, [lower_percentile / 100, upper_percentile / 100])
         
-        filtered_df = df[(df[column_name] >= lower_bound) & (df[column_name] <= upper_bound)].copy()
+        # Boolean indexing already returns a new frame, so no extra copy is needed
+        filtered_df = df[(values >= lower_bound) & (values <= upper_bound)]
         
         # Log filtering results
         removed_count = len(df) - len(filtered_df)
@@ -330,7 +569,11 @@ class DataManager:
         return filtered_df
     
     def filter_by_time_interval(self, df: pd.DataFrame, interval: str) -> pd.DataFrame:
-        """Filter DataFrame by time interval."""
+        """Filter DataFrame by time interval (Date must be sorted ascending).
+        
+        Returns a row slice of the input rather than a copy; use
+        add_technical_indicators() or .copy() before adding columns.
+        """
         if df.empty or interval == 'All_Time':
             return df
         
@@ -342,8 +585,12 @@ class DataManager:
         if not days or days == 'max':
             return df
         
-        cutoff_date = datetime.now() - timedelta(days=days)
-        return df[df['Date'] >= cutoff_date].copy()
+        # Kline dates are naive UTC (from epoch milliseconds), so the cutoff must be too
+        cutoff_date = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=days)
+        # Binary search for the first row on/after the cutoff instead of a full boolean mask
+        # (on the NumPy array, which promotes the microsecond cutoff to a common unit)
+        start = df['Date'].to_numpy().searchsorted(np.datetime64(cutoff_date), side='left')
+        return df.iloc[start:]
     
     def _calculate_price_change(self, df: pd.DataFrame, start_idx: int = -2, end_idx: int = -1) -> float:
         """Calculate percentage price change between two indices.
@@ -355,7 +602,8 @@ class DataManager:
         """
         if len(df) < abs(start_idx) + 1:
             return 0.0
-        return (df['Close'].iloc[end_idx] - df['Close'].iloc[start_idx]) / df['Close'].iloc[start_idx] * 100
+        close = df['Close'].to_numpy()
+        return (close[end_idx] - close[start_idx]) / close[start_idx] * 100
     
     def calculate_all_time_stats(self, df: pd.DataFrame) -> Dict[str, float]:
         """Calculate all-time statistics across entire DataFrame.
@@ -373,11 +621,12 @@ class DataManager:
                 'price_change_24h': 0
             }
         
+        close = df['Close'].to_numpy()
         return {
-            'current_price': df['Close'].iloc[-1],
-            'ath': df['High'].max(),
-            'atl': df['Low'].min(),
-            'avg_volume': df['Volume'].mean(),
+            'current_price': close[-1],
+            'ath': np.nanmax(df['High'].to_numpy()),
+            'atl': np.nanmin(df['Low'].to_numpy()),
+            'avg_volume': np.nanmean(df['Volume'].to_numpy()),
             'price_change_24h': self._calculate_price_change(df, -2, -1)
         }
     
@@ -398,15 +647,24 @@ class DataManager:
                 'data_points': 0
             }
         
+        close = df['Close'].to_numpy()
         return {
-            'current_price': df['Close'].iloc[-1],
+            'current_price': close[-1],
             'period_change': self._calculate_price_change(df, 0, -1),
-            'period_high': df['High'].max(),
-            'period_low': df['Low'].min(),
-            'avg_volume': df['Volume'].mean(),
+            'period_high': np.nanmax(df['High'].to_numpy()),
+            'period_low': np.nanmin(df['Low'].to_numpy()),
+            'avg_volume': np.nanmean(df['Volume'].to_numpy()),
             'data_points': len(df)
         }
     
+    @staticmethod
+    def _latest_value(df: pd.DataFrame, column: str) -> Optional[float]:
+        """Last value of a column, or None if the column is missing or the value is NaN."""
+        if column not in df.columns:
+            return None
+        value = df[column].iat[-1]
+        return None if pd.isna(value) else value
+    
     def get_indicator_values(self, df: pd.DataFrame) -> Dict:
         """Extract technical indicator values from DataFrame (must have indicators added).
         
@@ -424,10 +682,10 @@ class DataManager:
             }
         
         # Get latest values if columns exist
-        sma_50 = df['SMA_50'].iloc[-1] if 'SMA_50' in df.columns and not df['SMA_50'].isna().iloc[-1] else None
-        sma_200 = df['SMA_200'].iloc[-1] if 'SMA_200' in df.columns and not df['SMA_200'].isna().iloc[-1] else None
-        ema_50 = df['EMA_50'].iloc[-1] if 'EMA_50' in df.columns and not df['EMA_50'].isna().iloc[-1] else None
-        ema_200 = df['EMA_200'].iloc[-1] if 'EMA_200' in df.columns and not df['EMA_200'].isna().iloc[-1] else None
+        sma_50 = self._latest_value(df, 'SMA_50')
+        sma_200 = self._latest_value(df, 'SMA_200')
+        ema_50 = self._latest_value(df, 'EMA_50')
+        ema_200 = self._latest_value(df, 'EMA_200')
         
         # Determine trend based on SMAs
         trend = None
@@ -463,15 +721,60 @@ class DataManager:
         return self.get_indicator_values(df)
     
     def fetch_multiple_symbols(self, symbols: List[str]) -> Dict[str, pd.DataFrame]:
-        """Fetch data for multiple symbols."""
+        """Fetch data for multiple symbols concurrently."""
+        if not symbols:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(16, len(symbols))) as executor:
+            frames = list(executor.map(self.fetch_historical_data, symbols))
+        
         result = {}
-        for symbol in symbols:
-            df = self.fetch_historical_data(symbol)
+        for symbol, df in zip(symbols, frames):
             if not df.empty:
                 df = self.add_moving_averages(df)
                 result[symbol] = df
         return result
     
+    @staticmethod
+    def _align_on_date(df_asset: pd.DataFrame, df_market: pd.DataFrame) -> pd.DataFrame:
+        """Inner-join two price histories on Date into Close_asset / Close_market columns."""
+        return pd.merge(df_asset[['Date', 'Close']], df_market[['Date', 'Close']], 
+                        on='Date', suffixes=('_asset', '_market'))
+    
+    @staticmethod
+    def _correlation_from_aligned(aligned: pd.DataFrame, window: int) -> pd.Series:
+        """Rolling correlation of the Close columns of a frame from _align_on_date."""
+        if len(aligned) < window:
+            return pd.Series(dtype=float)
+        
+        # Calculate rolling correlation (O(N) sum-form instead of per-window .corr())
+        correlation = _rolling_corr(
+            aligned['Close_asset'].to_numpy(dtype=np.float64),
+            aligned['Close_market'].to_numpy(dtype=np.float64),
+            window
+        )
+        
+        return pd.Series(correlation, index=aligned.index)
+    
+    @staticmethod
+    def _returns_from_aligned(aligned: pd.DataFrame) -> Tuple[pd.Index, np.ndarray, np.ndarray]:
+        """Float64 simple returns of the Close columns of a frame from _align_on_date."""
+        returns_asset = aligned['Close_asset'].pct_change().to_numpy(dtype=np.float64)
+        returns_market = aligned['Close_market'].pct_change().to_numpy(dtype=np.float64)
+        
+        return aligned.index, returns_asset, returns_market
+    
+    @staticmethod
+    def _beta_from_returns(index: pd.Index, returns_asset: np.ndarray, returns_market: np.ndarray, window: int) -> pd.Series:
+        """Rolling beta Series from aligned return arrays."""
+        if len(index) < window + 1:
+            return pd.Series(dtype=float)
+        
+        # Calculate rolling beta: Covariance(asset, market) / Variance(market)
+        beta = _rolling_beta(returns_asset, returns_market, window)
+        
+        return pd.Series(beta, index=index)
+    
     def calculate_rolling_correlation(self, df1: pd.DataFrame, df2: pd.DataFrame, window: int = 30) -> pd.Series:
         """Calculate rolling Pearson correlation between two price series.
         
@@ -489,17 +792,7 @@ class DataManager:
         if df1.empty or df2.empty:
             return pd.Series(dtype=float)
         
-        # Align dataframes by date
-        merged = pd.merge(df1[['Date', 'Close']], df2[['Date', 'Close']], 
-                         on='Date', suffixes=('_1', '_2'))
-        
-        if len(merged) < window:
-            return pd.Series(dtype=float)
-        
-        # Calculate rolling correlation
-        correlation = merged['Close_1'].rolling(window=window).corr(merged['Close_2'])
-        
-        return correlation
+        return self._correlation_from_aligned(self._align_on_date(df1, df2), window)
     
     def calculate_beta_coefficient(self, df_asset: pd.DataFrame, df_market: pd.DataFrame, window: int = 30) -> pd.Series:
         """Calculate rolling beta coefficient (market sensitivity).
@@ -521,31 +814,27 @@ class DataManager:
         if df_asset.empty or df_market.empty:
             return pd.Series(dtype=float)
         
-        # Align dataframes by date
-        merged = pd.merge(df_asset[['Date', 'Close']], df_market[['Date', 'Close']], 
-                         on='Date', suffixes=('_asset', '_market'))
+        aligned = self._align_on_date(df_asset, df_market)
+        return self._beta_from_returns(*self._returns_from_aligned(aligned), window)
+    
+    def calculate_correlation_and_beta(self, df_asset: pd.DataFrame, df_market: pd.DataFrame,
+                                       window: int = 30) -> Tuple[pd.Series, pd.Series]:
+        """Rolling correlation and beta vs the market from a single date alignment.
         
-        if len(merged) < window + 1:
-            return pd.Series(dtype=float)
+        Equivalent to calling calculate_rolling_correlation() and
+        calculate_beta_coefficient() but joins the two histories only once.
         
-        # Calculate returns
-        merged['return_asset'] = merged['Close_asset'].pct_change()
-        merged['return_market'] = merged['Close_market'].pct_change()
+        Returns:
+            Tuple of (correlation series, beta series) sharing the aligned index
+        """
+        if df_asset.empty or df_market.empty:
+            return pd.Series(dtype=float), pd.Series(dtype=float)
         
-        # Calculate rolling beta: Covariance(asset, market) / Variance(market)
-        def rolling_beta(returns_asset, returns_market):
-            covariance = returns_asset.cov(returns_market)
-            variance = returns_market.var()
-            if variance == 0 or pd.isna(variance):
-                return float('nan')
-            return covariance / variance
-        
-        beta = merged['return_asset'].rolling(window=window).apply(
-            lambda x: rolling_beta(x, merged['return_market'].loc[x.index]), 
-            raw=False
-        )
+        aligned = self._align_on_date(df_asset, df_market)
+        correlation = self._correlation_from_aligned(aligned, window)
+        beta = self._beta_from_returns(*self._returns_from_aligned(aligned), window)
         
-        return beta
+        return correlation, beta
     
     def get_latest_correlation_beta(self, df_asset: pd.DataFrame, df_btc: pd.DataFrame, window: int = 30) -> Tuple[float, float]:
         """Get the latest correlation and beta values for an asset vs BTC.
@@ -558,10 +847,28 @@ class DataManager:
         Returns:
             Tuple of (correlation, beta) - both as floats
         """
-        correlation_series = self.calculate_rolling_correlation(df_asset, df_btc, window)
-        beta_series = self.calculate_beta_coefficient(df_asset, df_btc, window)
-        
-        correlation = correlation_series.iloc[-1] if not correlation_series.empty and not pd.isna(correlation_series.iloc[-1]) else 0.0
-        beta = beta_series.iloc[-1] if not beta_series.empty and not pd.isna(beta_series.iloc[-1]) else 0.0
+        if df_asset.empty or df_btc.empty:
+            return 0.0, 0.0
+        
+        # Align once; only the last window is needed, so skip the full rolling pass
+        merged = self._align_on_date(df_asset, df_btc)
+        close_asset = merged['Close_asset'].to_numpy(dtype=np.float64)
+        close_btc = merged['Close_market'].to_numpy(dtype=np.float64)
+        
+        correlation = float('nan')
+        if len(merged) >= window:
+            correlation = _rolling_corr(close_asset[-window:], close_btc[-window:], window)[-1]
+        
+        beta = float('nan')
+        if len(merged) >= window + 1:
+            tail_asset = close_asset[-(window + 1):]
+            tail_btc = close_btc[-(window + 1):]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                returns_asset = np.diff(tail_asset) / tail_asset[:-1]
+                returns_btc = np.diff(tail_btc) / tail_btc[:-1]
+            beta = _rolling_beta(returns_asset, returns_btc, window)[-1]
+        
+        correlation = 0.0 if pd.isna(correlation) else float(correlation)
+        beta = 0.0 if pd.isna(beta) else float(beta)
         
         return correlation, beta
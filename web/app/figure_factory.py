@@ -4,12 +4,14 @@ Centralized figure creation and styling utilities.
 This factory delegates to specialized figure modules for better code organization.
 """
 
+import functools
+
 import pandas as pd
 import plotly.graph_objects as go
 from typing import Dict, Optional, Tuple
 
 from components.colors import to_rgba
-from config import AppConfig
+from config import get_config
 from figures import (
     create_simple_price_chart as _create_simple_price_chart,
     create_candlestick as _create_candlestick,
@@ -22,7 +24,7 @@ class FigureFactory:
     """Factory class for creating standardized Plotly figures."""
     
     def __init__(self):
-        self.config = AppConfig()
+        self.config = get_config()
     
     def convert_color(self, color_name: str, opacity: float = 0.8) -> str:
         """Convert a color name to rgba format using shared utility."""
@@ -64,3 +66,9 @@ class FigureFactory:
         return _create_detailed_price_figure(
             df, symbol, period, mapped_range, legend_config, margins, self.config
         )
+
+
+@functools.lru_cache(maxsize=1)
+def get_figure_factory() -> FigureFactory:
+    """Return the shared FigureFactory instance (it holds no per-dashboard state)."""
+    return FigureFactory()
@@ -0,0 +1,35 @@
+"""
+Interpretation
+Plain-language descriptions of correlation and beta values.
+"""
+
+from typing import List
+
+
+def interpret_corr_beta(correlation: float, beta: float, symbol: str = 'ETH', reference: str = 'BTC') -> List[str]:
+    """Describe how strongly an asset is coupled to, and how volatile it is relative to, a reference.
+    
+    Args:
+        correlation: Pearson correlation vs the reference (-1 to +1)
+        beta: Beta coefficient vs the reference
+        symbol: Asset symbol used in the text
+        reference: Reference symbol used in the text (default 'BTC')
+    
+    Returns:
+        List of two lines: the coupling description and the volatility description
+    """
+    if correlation > 0.7:
+        coupling = f"🟢 {symbol} is strongly coupled with {reference} (correlation: {correlation:.3f})"
+    elif correlation > 0.3:
+        coupling = f"🟡 {symbol} has moderate correlation with {reference} (correlation: {correlation:.3f})"
+    else:
+        coupling = f"🔴 {symbol} is decoupled from {reference} (correlation: {correlation:.3f})"
+    
+    if beta > 1:
+        volatility = f"📈 {symbol} is {((beta - 1) * 100):.1f}% more volatile than {reference} (beta: {beta:.3f})"
+    elif beta < 1:
+        volatility = f"📉 {symbol} is {((1 - beta) * 100):.1f}% less volatile than {reference} (beta: {beta:.3f})"
+    else:
+        volatility = f"➡️  {symbol} moves in line with {reference} (beta: {beta:.3f})"
+    
+    return [coupling, volatility]
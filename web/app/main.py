@@ -9,7 +9,7 @@ import sys
 import panel as pn
 import param
 
-from config import AppConfig
+from config import get_config
 from dashboard_registry import DashboardRegistry
 
 # Ensure app directory is on sys.path so 'components' and other subpackages import reliably
@@ -20,6 +20,8 @@ for p in (str(_app_dir), str(_app_dir.parent)):
 
 pn.extension('plotly')
 
+_LOGO_PATH = str(_app_dir.resolve().parent / 'assets' / 'logo.png')
+
 class DashboardApp(param.Parameterized):
     """Main dashboard application class."""
     
@@ -27,7 +29,7 @@ class DashboardApp(param.Parameterized):
     
     def __init__(self, **params):
         super().__init__(**params)
-        self.config = AppConfig()
+        self.config = get_config()
         self.registry = DashboardRegistry()
         self.current_dashboard_instance = None
         self.registry.discover_dashboards()
@@ -108,6 +110,8 @@ class DashboardApp(param.Parameterized):
         """Load and display the selected dashboard."""
         try:
             dashboard_class = self.registry.get_dashboard(dashboard_name)
+            if dashboard_class is None:
+                raise KeyError(f"Unknown dashboard: {dashboard_name}")
             if dashboard_class:
                 # Create new dashboard instance
                 self.current_dashboard_instance = dashboard_class()
@@ -140,7 +144,7 @@ class DashboardApp(param.Parameterized):
         # Use FastListTemplate for proper title display
         template = pn.template.FastListTemplate(
             title="Cryptocurrency Dashboard",
-            logo=str(Path(__file__).resolve().parent.parent / 'assets' / 'logo.png'),
+            logo=_LOGO_PATH,
             main=[self.header_row, self.main_content],
             main_layout=None,
             accent=self.config.accent_color,
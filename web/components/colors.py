@@ -1,9 +1,17 @@
 """
 Color utilities for consistent RGBA conversion across charts.
 """
-import matplotlib.colors as mcolors
+import functools
 
 def to_rgba(color_name, opacity=1.0):
     """Convert color name to rgba string."""
+    return _to_rgba(color_name, float(opacity))
+
+@functools.lru_cache(maxsize=256)
+def _to_rgba(color_name, opacity):
+    """Cached conversion; the palette is a handful of colors and opacities."""
+    # matplotlib is imported on the first uncached conversion, not at startup
+    import matplotlib.colors as mcolors
+    
     rgba = mcolors.to_rgba(color_name, opacity)
     return f'rgba({int(rgba[0]*255)}, {int(rgba[1]*255)}, {int(rgba[2]*255)}, {rgba[3]})'
@@ -1,9 +1,9 @@
-from config import AppConfig
+from config import AppConfig, get_config
 from typing import Dict
 from components.colors import to_rgba
 def plotly_legend_config(title_text: str = "", config: AppConfig = None) -> Dict:
     if config is None:
-        config = AppConfig()
+        config = get_config()
     
     return dict(
         orientation="h",
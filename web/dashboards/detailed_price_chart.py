@@ -5,12 +5,11 @@ A detailed dashboard showing price chart with technical indicators and volume.
 
 import panel as pn
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 
 from base_dashboard import BaseDashboard
-from config import AppConfig
+from config import get_config
 from data_manager import DataManager
-from figure_factory import FigureFactory
+from figure_factory import get_figure_factory
 
 from components.explanations import technical_analysis_guide
 from components.layouts import plotly_legend_config, standard_margins
@@ -28,9 +27,9 @@ class DetailedPriceDashboard(BaseDashboard):
     
     def __init__(self):
         super().__init__()
-        self.config = AppConfig()
+        self.config = get_config()
         self.data_manager = DataManager()
-        self.figure_factory = FigureFactory()
+        self.figure_factory = get_figure_factory()
         
         # Dashboard state
         self.current_symbol = 'BTC'
@@ -42,6 +41,9 @@ class DetailedPriceDashboard(BaseDashboard):
         
         # Data storage
         self.current_data = None
+        # Last built figure as (inputs, data, figure); widget callbacks cascade and
+        # redraw several times with the same inputs
+        self._figure_cache = None
         
         # Create widgets
         self._create_widgets()
@@ -168,18 +170,31 @@ class DetailedPriceDashboard(BaseDashboard):
                 pass
         if filtered_data.empty:
             return pn.pane.Markdown("## No data available\n\nNo data found for the selected time period.")
-        # Use legend border color from config
-        legend_config = plotly_legend_config("<b>Select/deselect indicator by clicking on the text</b>")
-        legend_config['bordercolor'] = self.config.primary_color
-        fig = self.figure_factory.create_detailed_price_figure(
-            df=filtered_data,
-            symbol=self.current_symbol,
-            period=self.current_period,
-            mapped_range=getattr(self, '_mapped_date_range', None),
-            legend_config=legend_config,
-            margins=standard_margins(120, 160)
-        )
-        return pn.pane.Plotly(fig, sizing_mode='stretch_both', config={'responsive': True})
+        mapped_range = getattr(self, '_mapped_date_range', None)
+        key = (self.current_symbol, self.current_period, mapped_range)
+        cached = self._figure_cache
+        if cached is not None and cached[0] == key and cached[1] is self.current_data:
+            fig = cached[2]
+        else:
+            # Indicators over the plotted slice (as before), via DataManager's prefix-sum
+            # SMAs; the figure then uses these columns instead of recomputing them
+            filtered_data = self.data_manager.add_technical_indicators(filtered_data)
+            # Use legend border color from config
+            legend_config = plotly_legend_config("<b>Select/deselect indicator by clicking on the text</b>")
+            legend_config['bordercolor'] = self.config.primary_color
+            fig = self.figure_factory.create_detailed_price_figure(
+                df=filtered_data,
+                symbol=self.current_symbol,
+                period=self.current_period,
+                mapped_range=mapped_range,
+                legend_config=legend_config,
+                margins=standard_margins(120, 160)
+            )
+            # Holding current_data keeps the identity check above valid
+            self._figure_cache = (key, self.current_data, fig)
+        # The pane links itself to its figure and applies zoom/legend changes to it,
+        # so each pane gets its own copy and the cached figure stays pristine
+        return pn.pane.Plotly(go.Figure(fig), sizing_mode='stretch_both', config={'responsive': True})
 
     def _create_info_panel(self):
         if self.current_data is None or self.current_data.empty:
@@ -11,7 +11,7 @@ import plotly.graph_objects as go
 from base_dashboard import BaseDashboard
 from components.explanations import market_coupling_explanation
 from components.layouts import plotly_legend_config, standard_margins
-from config import AppConfig
+from config import get_config
 from data_manager import DataManager
 
 class MarketOverviewDashboard(BaseDashboard):
@@ -24,7 +24,7 @@ class MarketOverviewDashboard(BaseDashboard):
     
     def __init__(self):
         super().__init__()
-        self.config = AppConfig()
+        self.config = get_config()
         self.data_manager = DataManager()
         
         # Specific symbols for market overview
@@ -72,8 +72,11 @@ class MarketOverviewDashboard(BaseDashboard):
         self.low_365d_dict = {}
         
         try:
+            # Fetch all symbols concurrently (hourly + daily + weekly for comprehensive coverage)
+            frames = self.data_manager.fetch_combined_data_batch(self.symbols_usdt)
+            
             # First, load BTC data as reference
-            df_btc = self.data_manager.fetch_combined_data('BTCUSDT')
+            df_btc = frames.get('BTCUSDT', pd.DataFrame())
             if not df_btc.empty:
                 # Filter false ATH spikes (data errors)
                 df_btc = self.data_manager.filter_price_spikes(df_btc, spike_threshold=4.0)
@@ -103,8 +106,7 @@ class MarketOverviewDashboard(BaseDashboard):
                 if symbol == 'BTC':  # Already loaded
                     continue
                     
-                # Fetch combined data (hourly + daily + weekly for comprehensive coverage)
-                df = self.data_manager.fetch_combined_data(symbol_usdt)
+                df = frames.get(symbol_usdt, pd.DataFrame())
                 
                 if not df.empty:
                     # Filter false ATH spikes (data errors)
@@ -131,17 +133,15 @@ class MarketOverviewDashboard(BaseDashboard):
                     
                     # Calculate full historical rolling correlation and beta vs BTC
                     if not df_btc.empty:
-                        # Calculate historical rolling metrics (30-day window)
-                        corr_series = self.data_manager.calculate_rolling_correlation(df, df_btc, window=30)
-                        beta_series = self.data_manager.calculate_beta_coefficient(df, df_btc, window=30)
+                        # Calculate historical rolling metrics (30-day window) from one date alignment
+                        corr_series, beta_series = self.data_manager.calculate_correlation_and_beta(df, df_btc, window=30)
                         
                         self.correlation_series[symbol] = corr_series
                         self.beta_series[symbol] = beta_series
                         
-                        # Get latest values
-                        correlation, beta = self.data_manager.get_latest_correlation_beta(df, df_btc, window=30)
-                        self.correlation_dict[symbol] = correlation
-                        self.beta_dict[symbol] = beta
+                        # Latest values are the last points of the full series (0.0 if undefined)
+                        self.correlation_dict[symbol] = self._latest_or_zero(corr_series)
+                        self.beta_dict[symbol] = self._latest_or_zero(beta_series)
                     else:
                         self.correlation_dict[symbol] = 0.0
                         self.beta_dict[symbol] = 0.0
@@ -151,6 +151,13 @@ class MarketOverviewDashboard(BaseDashboard):
         except Exception as e:
             print(f"Error loading data: {e}")
     
+    @staticmethod
+    def _latest_or_zero(series):
+        """Last value of a series as a float, or 0.0 if it is empty or NaN."""
+        if series.empty or pd.isna(series.iat[-1]):
+            return 0.0
+        return float(series.iat[-1])
+    
     def _convert_color(self, color_name, opacity=1.0):
         """Convert a color name to rgba format using shared utility."""
         return to_rgba(color_name, opacity)
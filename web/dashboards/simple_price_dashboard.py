@@ -9,9 +9,9 @@ from base_dashboard import BaseDashboard
 from components.layouts import standard_margins
 from components.ui import create_header, create_summary_box
 from components.widgets import create_period_selector, create_range_widgets, create_symbol_selector
-from config import AppConfig
+from config import get_config
 from data_manager import DataManager
-from figure_factory import FigureFactory
+from figure_factory import get_figure_factory
 
 class SimplePriceDashboard(BaseDashboard):
     """Simple dashboard with one price chart for one symbol."""
@@ -23,9 +23,9 @@ class SimplePriceDashboard(BaseDashboard):
     
     def __init__(self):
         super().__init__()
-        self.config = AppConfig()
+        self.config = get_config()
         self.data_manager = DataManager()
-        self.figure_factory = FigureFactory()
+        self.figure_factory = get_figure_factory()
         
         # Dashboard state
         self.current_symbol = 'BTC'
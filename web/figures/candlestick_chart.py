@@ -26,14 +26,14 @@ def create_candlestick(
         title: Optional chart title
         x_range: Optional tuple of (start_date, end_date) for x-axis range
         margins: Optional dict of margins (l, r, t, b)
-        config: Optional AppConfig instance (creates new if not provided)
+        config: Optional AppConfig instance (uses the shared config if not provided)
     
     Returns:
         Plotly Figure object
     """
     if config is None:
-        from app.config import AppConfig
-        config = AppConfig()
+        from config import get_config
+        config = get_config()
     
     fig = go.Figure(data=[go.Candlestick(
         x=df['Date'],
@@ -4,8 +4,8 @@ Creates comprehensive price charts with technical indicators and volume.
 """
 
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 from components.colors import to_rgba
+import numpy as np
 import pandas as pd
 from typing import Optional, Dict, Tuple, TYPE_CHECKING
 
@@ -13,9 +13,19 @@ if TYPE_CHECKING:
     from app.config import AppConfig
 
 
+_INDICATOR_COLUMNS = ('SMA_50', 'SMA_200', 'EMA_50', 'EMA_200')
+_DEFAULT_MARGINS = dict(l=50, r=50, t=50, b=50)
+_GRID_STYLE = dict(showgrid=True, gridwidth=1, gridcolor='rgba(128, 128, 128, 0.2)')
+
+
 def _ensure_indicators(df: pd.DataFrame) -> pd.DataFrame:
     """Add required technical indicators if missing."""
-    df = df.copy()
+    # The detailed dashboard passes frames from DataManager.add_technical_indicators
+    if all(column in df.columns for column in _INDICATOR_COLUMNS):
+        return df
+    
+    # Shallow copy: only the missing indicator columns are allocated
+    df = df.copy(deep=False)
     if 'SMA_50' not in df.columns:
         df['SMA_50'] = df['Close'].rolling(window=50).mean()
     if 'SMA_200' not in df.columns:
@@ -59,16 +69,23 @@ def _aggregate_volume(
 ) -> pd.DataFrame:
     """Aggregate volume by day/week/month depending on selected period."""
     resample_period = _get_resample_period(period, date_range)
-    
-    # Set 'Date' as the index for resampling
-    df_resample = df.set_index('Date')
-    
-    # Resample the data
-    df_agg = df_resample.resample(resample_period).agg({
+    aggregations = {
         'Volume': 'sum',
         'Close': 'last',
         'Open': 'first'
-    }).dropna().reset_index()
+    }
+    
+    if resample_period == 'M':
+        # Month start as one vectorized datetime64 cast; the 'M' resample alias
+        # was removed in pandas 3 (renamed 'ME', which older pandas rejects)
+        month = df['Date'].to_numpy().astype('datetime64[M]').astype(df['Date'].dtype)
+        df_agg = df.groupby(month, sort=False).agg(aggregations)
+        df_agg.index.name = 'Date'
+        return df_agg.dropna().reset_index()
+    
+    # Resample on the Date column directly instead of rebuilding the whole
+    # frame (indicator columns included) with set_index
+    df_agg = df.resample(resample_period, on='Date').agg(aggregations).dropna().reset_index()
     
     return df_agg
 
@@ -92,14 +109,14 @@ def create_detailed_price_figure(
         mapped_range: Optional tuple of (start_date, end_date) for x-axis range
         legend_config: Optional dict for legend configuration
         margins: Optional dict of margins (l, r, t, b)
-        config: Optional AppConfig instance (creates new if not provided)
+        config: Optional AppConfig instance (uses the shared config if not provided)
     
     Returns:
         Plotly Figure object with subplots for price+indicators and volume
     """
     if config is None:
-        from app.config import AppConfig
-        config = AppConfig()
+        from config import get_config
+        config = get_config()
 
     if df.empty:
         fig = go.Figure()
@@ -111,7 +128,12 @@ def create_detailed_price_figure(
         )
         return fig
 
+    # plotly.subplots is slow to import and only needed once there is data to plot
+    from plotly.subplots import make_subplots
+
     df = _ensure_indicators(df)
+    # One Date array shared by all price traces instead of converting the Series per trace
+    dates = df['Date'].to_numpy()
 
     primary_color = config.get_crypto_color(symbol, 'primary')
     secondary_color = config.get_crypto_color(symbol, 'secondary')
@@ -135,56 +157,53 @@ def create_detailed_price_figure(
         for annotation in annotations:
             annotation.update(font=dict(size=18, color=config.primary_text_color), y=annotation.y + 0.04)
 
-    # Price traces
-    fig.add_trace(go.Scatter(
-        x=df['Date'], y=df['High'], mode='lines', name='High',
-        line=dict(color=to_rgba(primary_color, 0.4), width=1),
-        hovertemplate='<b>High</b>: <b>$%{y:,.2f}</b><extra></extra>'
-    ), row=1, col=1)
-    
-    fig.add_trace(go.Scatter(
-        x=df['Date'], y=df['Low'], mode='lines', name='Low',
-        line=dict(color=to_rgba(secondary_color, 0.4), width=1),
-        hovertemplate='<b>Low</b>: <b>$%{y:,.2f}</b><extra></extra>'
-    ), row=1, col=1)
-    
-    fig.add_trace(go.Scatter(
-        x=df['Date'], y=df['Close'], mode='lines', name='Close',
-        line=dict(color=color_a, width=2),
-        hovertemplate='<b>Close</b>: <b>$%{y:,.2f}</b><extra></extra>'
-    ), row=1, col=1)
-
-    # SMA/EMA indicators
-    fig.add_trace(go.Scatter(
-        x=df['Date'], y=df['SMA_50'], mode='lines', name='SMA 50',
-        line=dict(color=config.red_color, width=1.5, dash='dash'),
-        hovertemplate='<b>SMA 50</b>: <b>$%{y:,.2f}</b><extra></extra>'
-    ), row=1, col=1)
-    
-    fig.add_trace(go.Scatter(
-        x=df['Date'], y=df['SMA_200'], mode='lines', name='SMA 200',
-        line=dict(color=config.blue_color, width=1.5, dash='dash'),
-        hovertemplate='<b>SMA 200</b>: <b>$%{y:,.2f}</b><extra></extra>'
-    ), row=1, col=1)
-    
-    fig.add_trace(go.Scatter(
-        x=df['Date'], y=df['EMA_50'], mode='lines', name='EMA 50',
-        line=dict(color=config.orange_color, width=1.5, dash='dot'),
-        hovertemplate='<b>EMA 50</b>: <b>$%{y:,.2f}</b><extra></extra>'
-    ), row=1, col=1)
-    
-    fig.add_trace(go.Scatter(
-        x=df['Date'], y=df['EMA_200'], mode='lines', name='EMA 200',
-        line=dict(color=config.green_color, width=1.5, dash='dot'),
-        hovertemplate='<b>EMA 200</b>: <b>$%{y:,.2f}</b><extra></extra>'
-    ), row=1, col=1)
+    # Price and SMA/EMA traces go into the price subplot in a single add_traces call;
+    # they are WebGL scatters, which stay responsive on multi-year series
+    fig.add_traces([
+        go.Scattergl(
+            x=dates, y=df['High'], mode='lines', name='High',
+            line=dict(color=to_rgba(primary_color, 0.4), width=1),
+            hovertemplate='<b>High</b>: <b>$%{y:,.2f}</b><extra></extra>'
+        ),
+        go.Scattergl(
+            x=dates, y=df['Low'], mode='lines', name='Low',
+            line=dict(color=to_rgba(secondary_color, 0.4), width=1),
+            hovertemplate='<b>Low</b>: <b>$%{y:,.2f}</b><extra></extra>'
+        ),
+        go.Scattergl(
+            x=dates, y=df['Close'], mode='lines', name='Close',
+            line=dict(color=color_a, width=2),
+            hovertemplate='<b>Close</b>: <b>$%{y:,.2f}</b><extra></extra>'
+        ),
+        # SMA/EMA indicators
+        go.Scattergl(
+            x=dates, y=df['SMA_50'], mode='lines', name='SMA 50',
+            line=dict(color=config.red_color, width=1.5, dash='dash'),
+            hovertemplate='<b>SMA 50</b>: <b>$%{y:,.2f}</b><extra></extra>'
+        ),
+        go.Scattergl(
+            x=dates, y=df['SMA_200'], mode='lines', name='SMA 200',
+            line=dict(color=config.blue_color, width=1.5, dash='dash'),
+            hovertemplate='<b>SMA 200</b>: <b>$%{y:,.2f}</b><extra></extra>'
+        ),
+        go.Scattergl(
+            x=dates, y=df['EMA_50'], mode='lines', name='EMA 50',
+            line=dict(color=config.orange_color, width=1.5, dash='dot'),
+            hovertemplate='<b>EMA 50</b>: <b>$%{y:,.2f}</b><extra></extra>'
+        ),
+        go.Scattergl(
+            x=dates, y=df['EMA_200'], mode='lines', name='EMA 200',
+            line=dict(color=config.green_color, width=1.5, dash='dot'),
+            hovertemplate='<b>EMA 200</b>: <b>$%{y:,.2f}</b><extra></extra>'
+        )
+    ], rows=1, cols=1)
 
     # Volume subplot
     df_volume = _aggregate_volume(df, period, mapped_range)
-    colors = [
-        config.green_color if close >= open_ else config.red_color
-        for close, open_ in zip(df_volume['Close'], df_volume['Open'])
-    ]
+    colors = np.where(
+        df_volume['Close'].to_numpy() >= df_volume['Open'].to_numpy(),
+        config.green_color, config.red_color
+    ).tolist()
     
     fig.add_trace(go.Bar(
         x=df_volume['Date'], y=df_volume['Volume'], name='Volume',
@@ -204,7 +223,7 @@ def create_detailed_price_figure(
         yaxis2_title="Volume",
         xaxis_rangeslider_visible=False,
         autosize=True,
-        margin=margins or dict(l=50, r=50, t=50, b=50)
+        margin=margins or _DEFAULT_MARGINS
     )
 
     if mapped_range:
@@ -224,8 +243,8 @@ def create_detailed_price_figure(
             pass
 
     # Grid styling
-    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='rgba(128, 128, 128, 0.2)')
-    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='rgba(128, 128, 128, 0.2)')
+    fig.update_xaxes(**_GRID_STYLE)
+    fig.update_yaxes(**_GRID_STYLE)
     fig.update_yaxes(row=2, col=1, tickformat='.2s')
 
     return fig
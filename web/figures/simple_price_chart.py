@@ -27,14 +27,14 @@ def create_simple_price_chart(
         df: DataFrame with 'Date' and 'Close' columns
         symbol: Cryptocurrency symbol (e.g., 'BTC', 'ETH')
         title: Optional chart title
-        config: Optional AppConfig instance (creates new if not provided)
+        config: Optional AppConfig instance (uses the shared config if not provided)
     
     Returns:
         Plotly Figure object
     """
     if config is None:
-        from app.config import AppConfig
-        config = AppConfig()
+        from config import get_config
+        config = get_config()
     
     if df.empty:
         # Return empty chart with message
@@ -55,7 +55,7 @@ def create_simple_price_chart(
     # ...removed local convert_color...
     
     # Add price line with fill
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=df['Date'],
         y=df['Close'],
         mode='lines',
@@ -3,6 +3,7 @@ Volume Chart
 Creates volume bar charts for trading volume visualization.
 """
 
+import numpy as np
 import plotly.graph_objects as go
 import pandas as pd
 from typing import Optional, Dict, Tuple, TYPE_CHECKING
@@ -26,21 +27,21 @@ def create_volume_only(
         title: Optional chart title
         x_range: Optional tuple of (start_date, end_date) for x-axis range
         margins: Optional dict of margins (l, r, t, b)
-        config: Optional AppConfig instance (creates new if not provided)
+        config: Optional AppConfig instance (uses the shared config if not provided)
     
     Returns:
         Plotly Figure object
     """
     if config is None:
-        from app.config import AppConfig
-        config = AppConfig()
+        from config import get_config
+        config = get_config()
     
     # Use red/green colors for volume bars based on price movement if 'Open' and 'Close' columns are present.
     if 'Open' in df.columns and 'Close' in df.columns:
-        bar_colors = [
-            config.green_color if close >= open_ else config.red_color
-            for open_, close in zip(df['Open'], df['Close'])
-        ]
+        bar_colors = np.where(
+            df['Close'].to_numpy() >= df['Open'].to_numpy(),
+            config.green_color, config.red_color
+        ).tolist()
     else:
         # Default to blue if price columns are missing
         bar_colors = [config.blue_color] * len(df)